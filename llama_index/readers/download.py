@@ -23,10 +23,14 @@ LLAMA_HUB_CONTENTS_URL = "https://raw.githubusercontent.com/emptycrown/llama-hub
 LOADER_HUB_PATH = "/llama_hub"
 LOADER_HUB_URL = LLAMA_HUB_CONTENTS_URL + LOADER_HUB_PATH
 
+# Shared session so that the several files fetched per loader reuse
+# the same keep-alive connection instead of re-handshaking each time.
+_SESSION = requests.Session()
+
 
 def _get_file_content(loader_hub_url: str, path: str) -> Tuple[str, int]:
     """Get the content of a file from the GitHub REST API."""
-    resp = requests.get(loader_hub_url + path)
+    resp = _SESSION.get(loader_hub_url + path)
     return resp.text, resp.status_code
 
 